@@ -1,8 +1,10 @@
 import asyncio
 import json
 import logging
+import os
 import random
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import websockets
@@ -10,6 +12,7 @@ from websockets.server import WebSocketServerProtocol
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from scenarios import Scenario, ScenarioCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -63,7 +66,7 @@ class PricePoint:
         self.is_trade_day = is_trade_day
 
 class GameState:
-    def __init__(self):
+    def __init__(self, scenario: Optional[Scenario] = None):
         self.current_round = 1
         self.phase = "LOBBY"  # LOBBY, SETUP, TRADING, PROCESSING, RESULTS, FINISHED
         self.players: Dict[str, Player] = {}
@@ -76,81 +79,19 @@ class GameState:
         self.consolidated_orders: Dict[str, Dict] = {"BUY": {}, "SELL": {}}  # For displaying consolidated orders
         self.previous_round_orders: List[Order] = []  # Store ALL orders from previous round (pending + executed)
         
-        # Initialize price history
-        self._generate_price_history()
-
-    def _generate_price_history(self):
-        """Generate synthetic price history for 20 days with high volatility"""
-        # Start at 70, end at 50, with peaks at 100 and valleys at 20
-        prices = []
-        
-        # Day 1-3: Start high and decline
-        current_price = 70
-        for day in range(1, 4):
-            volatility = random.uniform(-3, 3)
-            current_price = current_price * (0.95 + volatility/100)
-            current_price = max(20, min(100, current_price))
-            prices.append((day, int(round(current_price))))
-        
-        # Day 4-6: Sharp decline to valley (around 20)
-        target_low = 20
-        for day in range(4, 7):
-            decline = random.uniform(15, 25)  # Sharp decline
-            volatility = random.uniform(-2, 2)
-            current_price = current_price * (1 - decline/100 + volatility/100)
-            current_price = max(20, current_price)
-            prices.append((day, int(round(current_price))))
-        
-        # Day 7-9: Recovery from valley
-        for day in range(7, 10):
-            recovery = random.uniform(10, 20)
-            volatility = random.uniform(-3, 3)
-            current_price = current_price * (1 + recovery/100 + volatility/100)
-            current_price = max(20, min(100, current_price))
-            prices.append((day, int(round(current_price))))
-        
-        # Day 10-12: Sharp rise to peak (around 100)
-        for day in range(10, 13):
-            surge = random.uniform(15, 25)
-            volatility = random.uniform(-2, 2)
-            current_price = current_price * (1 + surge/100 + volatility/100)
-            current_price = min(100, current_price)
-            prices.append((day, int(round(current_price))))
-        
-        # Day 13-15: Peak volatility around 100
-        for day in range(13, 16):
-            volatility = random.uniform(-8, 8)  # High volatility at peak
-            current_price = current_price * (1 + volatility/100)
-            current_price = max(80, min(100, current_price))  # Keep near peak
-            prices.append((day, int(round(current_price))))
+        # Scenario is loaded at app startup unless one is passed in
+        self.scenario: Optional[Scenario] = None
+        if scenario:
+            self.load_scenario(scenario)
+
+    def load_scenario(self, scenario: Scenario):
+        """Load historical prices and external investor schedule from a scenario"""
+        self.scenario = scenario
+        self.price_history = [PricePoint(day, price) for day, price in enumerate(scenario.prices, start=1)]
         
-        # Day 16-18: Gradual decline from peak
-        for day in range(16, 19):
-            decline = random.uniform(8, 15)
-            volatility = random.uniform(-3, 3)
-            current_price = current_price * (1 - decline/100 + volatility/100)
-            current_price = max(40, current_price)
-            prices.append((day, int(round(current_price))))
-        
-        # Day 19-20: Final adjustment to reach 50
-        for day in range(19, 21):
-            if day == 20:
-                # Force final price to be 50
-                current_price = 50
-            else:
-                # Adjust towards 50
-                target_adjustment = (50 - current_price) * 0.5
-                volatility = random.uniform(-2, 2)
-                current_price = current_price + target_adjustment + volatility
-                current_price = max(30, min(70, current_price))
-            prices.append((day, int(round(current_price))))
-        
-        # Create price history
-        for day, price in prices:
-            self.price_history.append(PricePoint(day, price))
-        
-        # Set current price to 50 (final historical price)
-        self.current_prices = {"CAMB": 50}
+        # Set current price to the final historical price
+        self.current_prices = {"CAMB": scenario.prices[-1]}
+        logger.info(f"Loaded scenario {scenario.index} (seed {scenario.seed})")
 
     def add_player(self, player_id: str, name: str, is_monitor: bool = False):
         """Add a new player to the game"""
@@ -185,38 +126,25 @@ class GameState:
                 player.is_done = True
 
     def add_external_investor_orders(self):
-        """Add external investor orders at specific rounds"""
-        if self.current_round == 4:
-            # External investor sells 500 shares at 50% of last round price
-            sell_price = int(self.current_prices["CAMB"] * 0.5)
-            external_order = Order(
-                f"external-sell-{int(time.time())}",
-                "external_investor_1",
-                "External Investor (Seller)",
-                "CAMB",
-                "SELL",
-                sell_price,
-                500,
-                self.current_round
-            )
-            self.orders.append(external_order)
-            logger.info(f"Added external sell order: 500 shares at ${sell_price}")
-            
-        elif self.current_round == 7:
-            # External investor buys 500 shares at 200% of last round price
-            buy_price = int(self.current_prices["CAMB"] * 2.0)
+        """Add external investor orders scheduled by the scenario for this round"""
+        if not self.scenario:
+            raise RuntimeError("No scenario loaded - call load_scenario() before starting a round")
+        
+        for event in self.scenario.investor_events_for_round(self.current_round):
+            # External investor trades at a multiple of last round price
+            price = int(self.current_prices["CAMB"] * event.price_factor)
             external_order = Order(
-                f"external-buy-{int(time.time())}",
-                "external_investor_2", 
-                "External Investor (Buyer)",
+                f"external-{event.type.lower()}-{event.player_id}-{int(time.time())}",
+                event.player_id,
+                event.player_name,
                 "CAMB",
-                "BUY",
-                buy_price,
-                500,
+                event.type,
+                price,
+                event.quantity,
                 self.current_round
             )
             self.orders.append(external_order)
-            logger.info(f"Added external buy order: 500 shares at ${buy_price}")
+            logger.info(f"Added external {event.type.lower()} order: {event.quantity} shares at ${price}")
 
     def consolidate_orders_from_previous_round(self):
         """Consolidate ALL orders from the previous round for display (both pending and executed)"""
@@ -423,8 +351,23 @@ class GameState:
 # Global game state
 game_state = GameState()
 
+# Pre-built scenarios, filled at startup so game creation never generates paths
+scenario_cache = ScenarioCache(
+    int(os.environ.get("SCENARIO_SEED", "0")),
+    int(os.environ.get("SCENARIO_CACHE_SIZE", "256"))
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the scenario cache and pick the scenario for this game"""
+    scenario_cache.warm()
+    index = os.environ.get("SCENARIO_INDEX")
+    index = int(index) if index is not None else random.randrange(scenario_cache.size)
+    game_state.load_scenario(scenario_cache.get(index))
+    yield
+
 # FastAPI app
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -435,6 +378,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 async def broadcast_game_update():
     """Broadcast game state update to all connected clients"""
     if not game_state.websockets:
@@ -610,7 +554,7 @@ async def process_round():
     # Add new price point to history if there were trades
     if new_trades:
         game_state.price_history.append(PricePoint(
-            20 + game_state.current_round,  # Updated to reflect 20 historical days
+            len(game_state.scenario.prices) + game_state.current_round,  # Trade days follow the historical days
             new_prices["CAMB"],
             game_state.current_round,
             True
@@ -0,0 +1,196 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Scenario parameter types
+class PriceSegment:
+    def __init__(self, days: int, trend: Tuple[float, float], volatility: float,
+                 floor: Optional[float] = None, cap: Optional[float] = None):
+        # Daily move is 1 + U(trend)/100 + U(-volatility, volatility)/100, then clipped
+        self.days = days
+        self.trend = trend
+        self.volatility = volatility
+        self.floor = floor
+        self.cap = cap
+
+class InvestorSpec:
+    def __init__(self, player_id: str, player_name: str, order_type: str,
+                 rounds: Tuple[int, int], price_factor: float, quantity: int):
+        self.player_id = player_id
+        self.player_name = player_name
+        self.type = order_type
+        self.rounds = rounds  # Inclusive range the order round is drawn from
+        self.price_factor = price_factor  # Multiple of the last round price
+        self.quantity = quantity
+
+class ScenarioParams:
+    def __init__(self,
+                 start_price: float = 70,
+                 segments: Optional[List[PriceSegment]] = None,
+                 reversion_days: int = 1,
+                 reversion_strength: float = 0.5,
+                 reversion_noise: float = 2,
+                 reversion_band: Tuple[float, float] = (30, 70),
+                 final_price: int = 50,
+                 investors: Optional[List[InvestorSpec]] = None):
+        self.start_price = start_price
+        self.segments = segments if segments is not None else default_segments()
+        self.reversion_days = reversion_days
+        self.reversion_strength = reversion_strength
+        self.reversion_noise = reversion_noise
+        self.reversion_band = reversion_band
+        self.final_price = final_price
+        self.investors = investors if investors is not None else default_investors()
+
+    @property
+    def num_days(self) -> int:
+        """Number of historical days in a generated price path"""
+        return sum(s.days for s in self.segments) + self.reversion_days + 1
+
+    @property
+    def draws_per_path(self) -> int:
+        """Number of uniform draws consumed by one scenario"""
+        return 2 * sum(s.days for s in self.segments) + self.reversion_days + len(self.investors)
+
+def default_segments() -> List[PriceSegment]:
+    """Start at 70, fall to a valley around 20, rally to a peak around 100, then settle"""
+    return [
+        PriceSegment(3, (-5, -5), 3, floor=20, cap=100),   # Day 1-3: start high and decline
+        PriceSegment(3, (-25, -15), 2, floor=20),          # Day 4-6: sharp decline to valley
+        PriceSegment(3, (10, 20), 3, floor=20, cap=100),   # Day 7-9: recovery from valley
+        PriceSegment(3, (15, 25), 2, cap=100),             # Day 10-12: sharp rise to peak
+        PriceSegment(3, (0, 0), 8, floor=80, cap=100),     # Day 13-15: peak volatility
+        PriceSegment(3, (-15, -8), 3, floor=40),           # Day 16-18: gradual decline
+    ]
+
+def default_investors() -> List[InvestorSpec]:
+    """External seller at round 4 (50% of price) and buyer at round 7 (200% of price)"""
+    return [
+        InvestorSpec("external_investor_1", "External Investor (Seller)", "SELL", (4, 4), 0.5, 500),
+        InvestorSpec("external_investor_2", "External Investor (Buyer)", "BUY", (7, 7), 2.0, 500),
+    ]
+
+# Generated scenario types
+class InvestorEvent:
+    def __init__(self, spec: InvestorSpec, round_num: int):
+        self.player_id = spec.player_id
+        self.player_name = spec.player_name
+        self.type = spec.type
+        self.round = round_num
+        self.price_factor = spec.price_factor
+        self.quantity = spec.quantity
+
+class Scenario:
+    def __init__(self, seed: int, index: int, prices: List[int], investor_events: List[InvestorEvent]):
+        self.seed = seed
+        self.index = index
+        self.prices = prices  # Day 1..N closing prices
+        self.investor_events = investor_events
+
+    def investor_events_for_round(self, round_num: int) -> List[InvestorEvent]:
+        """Get external investor events scheduled for a round"""
+        return [e for e in self.investor_events if e.round == round_num]
+
+def _draw_uniforms(seed: int, start: int, count: int, params: ScenarioParams) -> np.ndarray:
+    """Draw the uniform block for scenarios [start, start + count) of a seed.
+
+    Every scenario consumes a fixed-width row of one sequential stream, so
+    scenario ``i`` is identical no matter how many are generated per batch.
+    """
+    width = params.draws_per_path
+    rng = np.random.Generator(np.random.PCG64(seed))
+    if start:
+        rng.bit_generator.advance(start * width)
+    return rng.random((count, width))
+
+def generate_price_paths(params: ScenarioParams, uniforms: np.ndarray) -> np.ndarray:
+    """Generate integer price paths, one row per scenario, from a block of uniforms"""
+    count = uniforms.shape[0]
+    paths = np.empty((count, params.num_days), dtype=np.int64)
+    current = np.full(count, float(params.start_price))
+    day = 0
+    col = 0
+
+    for segment in params.segments:
+        low, high = segment.trend
+        trend = low + (high - low) * uniforms[:, col:col + segment.days]
+        col += segment.days
+        noise = segment.volatility * (2 * uniforms[:, col:col + segment.days] - 1)
+        col += segment.days
+        factors = 1 + trend / 100 + noise / 100
+        for i in range(segment.days):
+            current = current * factors[:, i]
+            if segment.floor is not None or segment.cap is not None:
+                current = np.clip(current, segment.floor, segment.cap)
+            paths[:, day] = np.rint(current)
+            day += 1
+
+    # Pull towards the final price before pinning the last day to it
+    band_low, band_high = params.reversion_band
+    for i in range(params.reversion_days):
+        noise = params.reversion_noise * (2 * uniforms[:, col] - 1)
+        col += 1
+        current = current + (params.final_price - current) * params.reversion_strength + noise
+        current = np.clip(current, band_low, band_high)
+        paths[:, day] = np.rint(current)
+        day += 1
+
+    paths[:, day] = params.final_price
+    return paths
+
+def generate_investor_rounds(params: ScenarioParams, uniforms: np.ndarray) -> np.ndarray:
+    """Draw the round of each external investor order, one row per scenario"""
+    col = params.draws_per_path - len(params.investors)
+    rounds = np.empty((uniforms.shape[0], len(params.investors)), dtype=np.int64)
+    for i, spec in enumerate(params.investors):
+        low, high = spec.rounds
+        rounds[:, i] = low + np.floor(uniforms[:, col + i] * (high - low + 1)).astype(np.int64)
+    return rounds
+
+def generate_scenarios(seed: int, count: int, params: Optional[ScenarioParams] = None,
+                       start: int = 0) -> List[Scenario]:
+    """Generate scenarios [start, start + count) for a seed in one vectorized pass"""
+    if start < 0:
+        raise ValueError(f"Scenario index must be non-negative, got {start}")
+    params = params or ScenarioParams()
+    uniforms = _draw_uniforms(seed, start, count, params)
+    paths = generate_price_paths(params, uniforms)
+    rounds = generate_investor_rounds(params, uniforms)
+
+    return [
+        Scenario(
+            seed,
+            start + i,
+            paths[i].tolist(),
+            [InvestorEvent(spec, int(rounds[i, j])) for j, spec in enumerate(params.investors)]
+        )
+        for i in range(count)
+    ]
+
+class ScenarioCache:
+    def __init__(self, seed: int, size: int, params: Optional[ScenarioParams] = None):
+        if size < 1:
+            raise ValueError(f"Scenario cache size must be at least 1, got {size}")
+        self.seed = seed
+        self.size = size
+        self.params = params or ScenarioParams()
+        self.scenarios: Dict[int, Scenario] = {}
+
+    def warm(self):
+        """Pre-build the first `size` scenarios"""
+        if all(i in self.scenarios for i in range(self.size)):
+            return
+        for scenario in generate_scenarios(self.seed, self.size, self.params):
+            self.scenarios.setdefault(scenario.index, scenario)
+        logger.info(f"Built {self.size} scenarios for seed {self.seed}")
+
+    def get(self, index: int) -> Scenario:
+        """Get a scenario by index, generating it if it is not cached"""
+        if index < 0:
+            raise ValueError(f"Scenario index must be non-negative, got {index}")
+        if index not in self.scenarios:
+            self.scenarios[index] = generate_scenarios(self.seed, 1, self.params, index)[0]
+        return self.scenarios[index]
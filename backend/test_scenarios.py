@@ -0,0 +1,42 @@
+import pytest
+
+from scenarios import InvestorSpec, ScenarioCache, ScenarioParams, generate_scenarios
+
+
+def _summary(scenario):
+    return scenario.prices, [(e.player_id, e.round) for e in scenario.investor_events]
+
+
+def test_scenario_is_independent_of_batch():
+    full = generate_scenarios(0, 100)
+    batch = generate_scenarios(0, 5, start=37)
+    assert [_summary(s) for s in full[37:42]] == [_summary(s) for s in batch]
+    assert [s.index for s in batch] == [37, 38, 39, 40, 41]
+
+
+def test_same_seed_gives_same_scenarios():
+    first = generate_scenarios(42, 10)
+    second = generate_scenarios(42, 10)
+    assert [_summary(s) for s in first] == [_summary(s) for s in second]
+    assert [_summary(s) for s in first] != [_summary(s) for s in generate_scenarios(43, 10)]
+
+
+def test_default_params_match_original_game():
+    params = ScenarioParams()
+    for scenario in generate_scenarios(0, 50, params):
+        assert len(scenario.prices) == 20
+        assert scenario.prices[-1] == params.final_price
+        assert [(e.type, e.round) for e in scenario.investor_events] == [("SELL", 4), ("BUY", 7)]
+
+
+def test_investor_rounds_stay_within_range():
+    params = ScenarioParams(investors=[InvestorSpec("x", "X", "BUY", (3, 8), 1.5, 100)])
+    rounds = {s.investor_events[0].round for s in generate_scenarios(0, 1000, params)}
+    assert rounds == set(range(3, 9))
+
+
+def test_cache_rejects_invalid_config():
+    with pytest.raises(ValueError):
+        ScenarioCache(0, 0)
+    with pytest.raises(ValueError):
+        ScenarioCache(0, 4).get(-1)